@@ -4,109 +4,249 @@ Lets Claude build, flash, and read logs from nRF54L15DK boards.
 """
 
 import asyncio
+import collections
+import functools
 import json
 import os
-import subprocess
+import re
+import signal
 import time
+import types
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 
 import serial
 import serial.tools.list_ports
+import serial_asyncio
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # optional speedup
+    _json_loads = json.loads
+
 # ─── Config ───────────────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=None)
 def _auto_detect_toolchain() -> str:
     """Find newest toolchain in ~/ncs/toolchains/ that contains west."""
     ncs_dir = Path.home() / "ncs" / "toolchains"
     if not ncs_dir.exists():
         return ""
-    candidates = [
-        d for d in ncs_dir.iterdir()
-        if (d / "usr" / "local" / "bin" / "west").exists()
-        or (d / "bin" / "west").exists()
-    ]
-    if not candidates:
-        return ""
-    return str(sorted(candidates)[-1])
+    with os.scandir(ncs_dir) as it:
+        newest = max(
+            (
+                e for e in it
+                if e.is_dir()
+                and (os.path.isfile(os.path.join(e.path, "usr", "local", "bin", "west"))
+                     or os.path.isfile(os.path.join(e.path, "bin", "west")))
+            ),
+            key=lambda e: e.name,
+            default=None,
+        )
+    return newest.path if newest else ""
 
+@functools.lru_cache(maxsize=None)
 def _find_west(toolchain: str) -> str:
-    for candidate in [
-        Path(toolchain) / "usr" / "local" / "bin" / "west",
-        Path(toolchain) / "bin" / "west",
-    ]:
-        if candidate.exists():
-            return str(candidate)
+    for candidate in (
+        os.path.join(toolchain, "usr", "local", "bin", "west"),
+        os.path.join(toolchain, "bin", "west"),
+    ):
+        if os.path.isfile(candidate):
+            return candidate
     return "west"
 
+_VERSION_RE = re.compile(r"v(\d+)\.(\d+)(?:\.(\d+))?(.*)")
+_DIGITS_RE = re.compile(r"\d+")
+
+def _ver_key(entry: os.DirEntry) -> tuple:
+    """Sort key so v2.10.0 ranks above v2.9.2 and v2.9.0 above v2.9.0-rc1."""
+    m = _VERSION_RE.match(entry.name)
+    if not m:
+        return (-1, -1, -1, (0,))
+    major, minor, patch, suffix = m.groups()
+    # A bare release outranks any pre-release (-rc1, -preview2, ...) of itself
+    pre = (1,) if not suffix else (0, tuple(int(x) for x in _DIGITS_RE.findall(suffix)))
+    return (int(major), int(minor), int(patch or 0), pre)
+
+@functools.lru_cache(maxsize=None)
 def _auto_detect_sdk() -> str:
     ncs_dir = Path.home() / "ncs"
     if not ncs_dir.exists():
         return ""
-    versions = sorted(
-        d for d in ncs_dir.iterdir()
-        if d.name.startswith("v") and (d / "zephyr").exists()
-    )
-    return str(versions[-1]) if versions else ""
+    with os.scandir(ncs_dir) as it:
+        newest = max(
+            (
+                e for e in it
+                if e.name.startswith("v") and e.is_dir()
+                and os.path.exists(os.path.join(e.path, "zephyr"))
+            ),
+            key=_ver_key,
+            default=None,
+        )
+    return newest.path if newest else ""
 
 TOOLCHAIN = os.environ.get("NRF_TOOLCHAIN") or _auto_detect_toolchain()
 SDK       = os.environ.get("NRF_SDK") or _auto_detect_sdk()
 WEST      = os.environ.get("NRF_WEST") or _find_west(TOOLCHAIN)
 JLINK_DIR = os.environ.get("JLINK_DIR", "/opt/SEGGER/JLink")
 
-ENV = {
+# Prefer the toolchain's nrfjprog, fall back to system nrfjprog
+_toolchain_nrfjprog = os.path.join(TOOLCHAIN, "bin", "nrfjprog")
+NRFJPROG = _toolchain_nrfjprog if TOOLCHAIN and os.path.isfile(_toolchain_nrfjprog) else "nrfjprog"
+
+ENV = types.MappingProxyType({
     **os.environ,
     "PATH": f"{TOOLCHAIN}/usr/local/bin:{TOOLCHAIN}/bin:{os.environ.get('PATH', '')}",
     "ZEPHYR_BASE": f"{SDK}/zephyr",
     "ZEPHYR_SDK_INSTALL_DIR": TOOLCHAIN,
-}
+})
 
 # ─── Helpers ──────────────────────────────────────────────────────────────────
 
-def run(cmd: list[str], cwd: str | None = None, timeout: int = 300) -> dict:
-    """Run a subprocess, return stdout/stderr/returncode."""
+# Max bytes per UART read — one read drains everything the driver has buffered.
+UART_READ_CHUNK = 65536
+
+# Tail of each stream kept per subprocess — bounds memory on verbose builds.
+RUN_MAX_LINES = 5000
+
+# Bytes per subprocess pipe read, and the longest unterminated line buffered
+# before it is emitted as-is.
+RUN_READ_CHUNK = 65536
+RUN_MAX_LINE_BYTES = 1024 * 1024
+
+
+async def _drain(stream: asyncio.StreamReader, lines: collections.deque) -> None:
+    # Fixed-size reads rather than readline(), so arbitrarily long lines are fine.
+    # \n, \r\n and lone \r all end a line, as with text-mode pipes.
+    buf = bytearray()
+    while chunk := await stream.read(RUN_READ_CHUNK):
+        buf += chunk
+        end = max(buf.rfind(b"\n"), buf.rfind(b"\r"))
+        if end == len(buf) - 1 and buf[end] == ord("\r"):
+            # Might be the first half of \r\n; wait for the next chunk.
+            end = max(buf.rfind(b"\n", 0, end), buf.rfind(b"\r", 0, end))
+        if end >= 0:
+            for line in buf[:end + 1].splitlines():
+                lines.append(line.decode("utf-8", errors="replace"))
+            del buf[:end + 1]
+        if len(buf) > RUN_MAX_LINE_BYTES:
+            lines.append(buf.decode("utf-8", errors="replace"))
+            buf.clear()
+    for line in buf.splitlines():
+        lines.append(line.decode("utf-8", errors="replace"))
+
+
+def _kill_group(proc: asyncio.subprocess.Process) -> None:
+    """Kill proc and everything it spawned (cmake, ninja, gcc, ...).
+
+    Grandchildren hold the output pipes open, so killing only the direct
+    child would leave the caller waiting on them.
+    """
     try:
-        result = subprocess.run(
-            cmd,
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+async def run(cmd: list[str], cwd: str | None = None, timeout: int = 300) -> dict:
+    """Run a subprocess without blocking the event loop, return stdout/stderr/returncode.
+
+    Output is streamed line by line and only the last RUN_MAX_LINES of each
+    stream are kept.
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
             cwd=cwd,
             env=ENV,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True,
         )
-        return {
-            "returncode": result.returncode,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
-            "ok": result.returncode == 0,
-        }
-    except subprocess.TimeoutExpired:
-        return {"returncode": -1, "stdout": "", "stderr": "Timeout", "ok": False}
     except FileNotFoundError as e:
         return {"returncode": -1, "stdout": "", "stderr": str(e), "ok": False}
 
+    stdout = collections.deque(maxlen=RUN_MAX_LINES)
+    stderr = collections.deque(maxlen=RUN_MAX_LINES)
+    tasks = [
+        asyncio.create_task(_drain(proc.stdout, stdout)),
+        asyncio.create_task(_drain(proc.stderr, stderr)),
+        asyncio.create_task(proc.wait()),
+    ]
+    try:
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+    except asyncio.CancelledError:
+        _kill_group(proc)
+        raise
+    finally:
+        for task in tasks:
+            task.cancel()
+    if pending:
+        _kill_group(proc)
+        return {"returncode": -1, "stdout": "", "stderr": "Timeout", "ok": False}
+
+    return {
+        "returncode": proc.returncode,
+        "stdout": "\n".join(stdout),
+        "stderr": "\n".join(stderr),
+        "ok": proc.returncode == 0,
+    }
+
 
 def fmt(result: dict, label: str) -> str:
     """Format a subprocess result for display."""
     status = "OK" if result["ok"] else f"FAILED (exit {result['returncode']})"
-    out = []
-    out.append(f"=== {label}: {status} ===")
-    if result["stdout"].strip():
-        out.append(result["stdout"].strip())
-    if result["stderr"].strip():
-        out.append("--- stderr ---")
-        out.append(result["stderr"].strip())
-    return "\n".join(out)
+    out_s = result["stdout"].strip()
+    err_s = result["stderr"].strip()
+    parts = [f"=== {label}: {status} ==="]
+    if out_s:
+        parts.append(out_s)
+    if err_s:
+        parts += ["--- stderr ---", err_s]
+    return "\n".join(parts)
+
+
+_VSCODE_CACHE: dict[str, tuple[tuple[int, int], dict]] = {}
 
 
 def get_vscode_config(sample_path: str) -> dict | None:
-    """Read .vscode-nrf-connect.json from sample's build dir."""
+    """Read .vscode-nrf-connect.json from sample's build dir (cached by mtime + size)."""
     cfg = Path(sample_path) / "build" / ".vscode-nrf-connect.json"
-    if cfg.exists():
-        return json.loads(cfg.read_text())
-    return None
+    try:
+        st = cfg.stat()
+    except OSError:
+        _VSCODE_CACHE.pop(sample_path, None)
+        return None
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _VSCODE_CACHE.get(sample_path)
+    if cached and cached[0] == key:
+        return cached[1]
+    parsed = _json_loads(cfg.read_bytes())
+    _VSCODE_CACHE[sample_path] = (key, parsed)
+    return parsed
+
+
+_PORTS_CACHE: tuple[float, list] | None = None
+
+
+def _comports_cached(ttl: float = 2.0) -> list:
+    """List serial ports, reusing the last scan if it is younger than ttl seconds."""
+    global _PORTS_CACHE
+    now = time.monotonic()
+    if _PORTS_CACHE is not None and now - _PORTS_CACHE[0] < ttl:
+        return _PORTS_CACHE[1]
+    ports = list(serial.tools.list_ports.comports())
+    _PORTS_CACHE = (now, ports)
+    return ports
+
+
+def _invalidate_comports() -> None:
+    global _PORTS_CACHE
+    _PORTS_CACHE = None
 
 
 # ─── MCP Server ───────────────────────────────────────────────────────────────
@@ -114,147 +254,141 @@ def get_vscode_config(sample_path: str) -> dict | None:
 server = Server("nrf-mcp")
 
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    return [
-        Tool(
-            name="build",
-            description="Build a Zephyr/nRF firmware sample using the nRF Connect SDK toolchain.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "sample_path": {
-                        "type": "string",
-                        "description": "Absolute path to the sample directory (e.g. /home/tsd/ncs/v2.9.2/ncs-zigbee/samples/ble_pi_direct/peripheral)",
-                    },
-                    "board": {
-                        "type": "string",
-                        "description": "Board target (e.g. nrf54l15dk/nrf54l15/cpuapp). If omitted, reads from build/.vscode-nrf-connect.json.",
-                    },
-                    "pristine": {
-                        "type": "boolean",
-                        "description": "Clean build (west build --pristine). Default false.",
-                    },
+_TOOLS_LIST: list[Tool] = [
+    Tool(
+        name="build",
+        description="Build a Zephyr/nRF firmware sample using the nRF Connect SDK toolchain.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "sample_path": {
+                    "type": "string",
+                    "description": "Absolute path to the sample directory (e.g. /home/tsd/ncs/v2.9.2/ncs-zigbee/samples/ble_pi_direct/peripheral)",
                 },
-                "required": ["sample_path"],
-            },
-        ),
-        Tool(
-            name="flash",
-            description="Flash firmware to a connected nRF board. Optionally build first.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "sample_path": {
-                        "type": "string",
-                        "description": "Absolute path to the sample directory.",
-                    },
-                    "board": {
-                        "type": "string",
-                        "description": "Board target. If omitted, reads from build/.vscode-nrf-connect.json.",
-                    },
-                    "build_first": {
-                        "type": "boolean",
-                        "description": "Build before flashing. Default false.",
-                    },
-                    "snr": {
-                        "type": "string",
-                        "description": "J-Link serial number for multi-board setups.",
-                    },
+                "board": {
+                    "type": "string",
+                    "description": "Board target (e.g. nrf54l15dk/nrf54l15/cpuapp). If omitted, reads from build/.vscode-nrf-connect.json.",
+                },
+                "pristine": {
+                    "type": "boolean",
+                    "description": "Clean build (west build --pristine). Default false.",
                 },
-                "required": ["sample_path"],
             },
-        ),
-        Tool(
-            name="read_uart_logs",
-            description="Read UART logs from a connected nRF board for a given number of seconds.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "port": {
-                        "type": "string",
-                        "description": "Serial port (e.g. /dev/ttyACM0). If omitted, auto-detects first Nordic port.",
-                    },
-                    "duration_s": {
-                        "type": "integer",
-                        "description": "How many seconds to read. Default 5.",
-                    },
-                    "baud": {
-                        "type": "integer",
-                        "description": "Baud rate. Default 115200.",
-                    },
+            "required": ["sample_path"],
+        },
+    ),
+    Tool(
+        name="flash",
+        description="Flash firmware to a connected nRF board. Optionally build first.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "sample_path": {
+                    "type": "string",
+                    "description": "Absolute path to the sample directory.",
+                },
+                "board": {
+                    "type": "string",
+                    "description": "Board target. If omitted, reads from build/.vscode-nrf-connect.json.",
+                },
+                "build_first": {
+                    "type": "boolean",
+                    "description": "Build before flashing. Default false.",
+                },
+                "snr": {
+                    "type": "string",
+                    "description": "J-Link serial number for multi-board setups.",
                 },
-                "required": [],
             },
-        ),
-        Tool(
-            name="reset_board",
-            description="Hard reset the nRF board via nrfjprog.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "snr": {
-                        "type": "string",
-                        "description": "J-Link serial number. If omitted, resets first found board.",
-                    },
+            "required": ["sample_path"],
+        },
+    ),
+    Tool(
+        name="read_uart_logs",
+        description="Read UART logs from a connected nRF board for a given number of seconds.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "port": {
+                    "type": "string",
+                    "description": "Serial port (e.g. /dev/ttyACM0). If omitted, auto-detects first Nordic port.",
+                },
+                "duration_s": {
+                    "type": "integer",
+                    "description": "How many seconds to read. Default 5.",
+                },
+                "baud": {
+                    "type": "integer",
+                    "description": "Baud rate. Default 115200.",
                 },
-                "required": [],
             },
-        ),
-        Tool(
-            name="list_boards",
-            description="List connected nRF J-Link boards and their serial numbers.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": [],
+            "required": [],
+        },
+    ),
+    Tool(
+        name="reset_board",
+        description="Hard reset the nRF board via nrfjprog.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "snr": {
+                    "type": "string",
+                    "description": "J-Link serial number. If omitted, resets first found board.",
+                },
             },
-        ),
-        Tool(
-            name="get_build_info",
-            description="Read build_info.yml and .vscode-nrf-connect.json from a sample's build directory.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "sample_path": {
-                        "type": "string",
-                        "description": "Absolute path to the sample directory.",
-                    },
+            "required": [],
+        },
+    ),
+    Tool(
+        name="list_boards",
+        description="List connected nRF J-Link boards and their serial numbers.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": [],
+        },
+    ),
+    Tool(
+        name="get_build_info",
+        description="Read build_info.yml and .vscode-nrf-connect.json from a sample's build directory.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "sample_path": {
+                    "type": "string",
+                    "description": "Absolute path to the sample directory.",
                 },
-                "required": ["sample_path"],
             },
-        ),
-    ]
+            "required": ["sample_path"],
+        },
+    ),
+]
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    return _TOOLS_LIST
 
 
 @server.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
-    if name == "build":
-        return await tool_build(arguments)
-    elif name == "flash":
-        return await tool_flash(arguments)
-    elif name == "read_uart_logs":
-        return await tool_read_uart(arguments)
-    elif name == "reset_board":
-        return await tool_reset(arguments)
-    elif name == "list_boards":
-        return await tool_list_boards(arguments)
-    elif name == "get_build_info":
-        return await tool_get_build_info(arguments)
-    else:
+    handler = _TOOLS.get(name)
+    if handler is None:
         return [TextContent(type="text", text=f"Unknown tool: {name}")]
+    return await handler(arguments)
 
 
 # ─── Tool Implementations ─────────────────────────────────────────────────────
 
 async def tool_build(args: dict) -> list[TextContent]:
     sample_path = args["sample_path"]
+    sample_name = os.path.basename(sample_path.rstrip("/"))
     pristine = args.get("pristine", False)
 
     # Resolve board from arg or .vscode-nrf-connect.json
     board = args.get("board")
     if not board:
-        cfg = get_vscode_config(sample_path)
+        cfg = await asyncio.to_thread(get_vscode_config, sample_path)
         if cfg:
             board = cfg.get("board")
     if not board:
@@ -264,12 +398,13 @@ async def tool_build(args: dict) -> list[TextContent]:
     if pristine:
         cmd.append("--pristine")
 
-    result = run(cmd, cwd=sample_path, timeout=300)
-    return [TextContent(type="text", text=fmt(result, f"BUILD {Path(sample_path).name} ({board})"))]
+    result = await run(cmd, cwd=sample_path, timeout=300)
+    return [TextContent(type="text", text=fmt(result, f"BUILD {sample_name} ({board})"))]
 
 
 async def tool_flash(args: dict) -> list[TextContent]:
     sample_path = args["sample_path"]
+    sample_name = os.path.basename(sample_path.rstrip("/"))
     build_first = args.get("build_first", False)
     snr = args.get("snr")
     output = []
@@ -278,14 +413,14 @@ async def tool_flash(args: dict) -> list[TextContent]:
     if build_first:
         board = args.get("board")
         if not board:
-            cfg = get_vscode_config(sample_path)
+            cfg = await asyncio.to_thread(get_vscode_config, sample_path)
             if cfg:
                 board = cfg.get("board")
         if not board:
             return [TextContent(type="text", text="ERROR: No board specified for build step.")]
 
-        build_result = run([WEST, "build", "-b", board, "--build-dir", "build"], cwd=sample_path)
-        output.append(fmt(build_result, f"BUILD {Path(sample_path).name}"))
+        build_result = await run([WEST, "build", "-b", board, "--build-dir", "build"], cwd=sample_path)
+        output.append(fmt(build_result, f"BUILD {sample_name}"))
         if not build_result["ok"]:
             return [TextContent(type="text", text="\n\n".join(output))]
 
@@ -294,8 +429,8 @@ async def tool_flash(args: dict) -> list[TextContent]:
     if snr:
         cmd += ["--snr", snr]
 
-    flash_result = run(cmd, cwd=sample_path, timeout=120)
-    output.append(fmt(flash_result, f"FLASH {Path(sample_path).name}"))
+    flash_result = await run(cmd, cwd=sample_path, timeout=120)
+    output.append(fmt(flash_result, f"FLASH {sample_name}"))
 
     return [TextContent(type="text", text="\n\n".join(output))]
 
@@ -305,34 +440,64 @@ async def tool_read_uart(args: dict) -> list[TextContent]:
     duration_s = args.get("duration_s", 5)
     baud = args.get("baud", 115200)
 
-    # Auto-detect Nordic USB CDC port
+    # Auto-detect Nordic USB CDC port, falling back to first ACM/USB port
     if not port:
-        for p in serial.tools.list_ports.comports():
+        preferred = fallback = None
+        for p in _comports_cached():
             if "Nordic" in (p.manufacturer or "") or "nRF" in (p.description or ""):
-                port = p.device
+                preferred = p.device
                 break
-        if not port:
-            # Fall back to first ACM port
-            for p in serial.tools.list_ports.comports():
-                if "ACM" in p.device or "ttyUSB" in p.device:
-                    port = p.device
-                    break
+            if fallback is None and ("ACM" in p.device or "ttyUSB" in p.device):
+                fallback = p.device
+        port = preferred or fallback
 
     if not port:
-        ports = [p.device for p in serial.tools.list_ports.comports()]
+        ports = [p.device for p in _comports_cached()]
         return [TextContent(type="text", text=f"ERROR: No serial port found. Available: {ports}")]
 
-    lines = []
     try:
-        with serial.Serial(port, baud, timeout=1) as ser:
-            end_time = time.time() + duration_s
-            while time.time() < end_time:
-                line = ser.readline()
-                if line:
-                    lines.append(line.decode("utf-8", errors="replace").rstrip())
+        reader, writer = await serial_asyncio.open_serial_connection(url=port, baudrate=baud)
     except serial.SerialException as e:
+        _invalidate_comports()
         return [TextContent(type="text", text=f"ERROR opening {port}: {e}")]
 
+    loop = asyncio.get_running_loop()
+    end_time = loop.time() + duration_s
+    buf = bytearray()
+    read_error = None
+    try:
+        while True:
+            remaining = end_time - loop.time()
+            if remaining <= 0:
+                break
+            # Take whatever has arrived in one read; split into lines once at the end.
+            chunk = await asyncio.wait_for(reader.read(UART_READ_CHUNK), timeout=remaining)
+            if not chunk:
+                break
+            buf += chunk
+    except asyncio.TimeoutError:
+        pass
+    except serial.SerialException as e:
+        # Port went away mid-capture (board reset, re-enumeration, unplug)
+        read_error = e
+        _invalidate_comports()
+    finally:
+        try:
+            writer.close()
+            await writer.wait_closed()
+        except (serial.SerialException, OSError):
+            pass  # closing a dead port can fail too; keep the read result
+
+    lines = [line.rstrip() for line in buf.decode("utf-8", errors="replace").split("\n")]
+    if lines and not lines[-1]:
+        lines.pop()
+
+    if read_error is not None:
+        output = f"ERROR reading {port}: {read_error}"
+        if lines:
+            output += f"\n=== UART LOG {port} (partial, {baud} baud) ===\n" + "\n".join(lines)
+        return [TextContent(type="text", text=output)]
+
     if not lines:
         return [TextContent(type="text", text=f"No output from {port} in {duration_s}s (baud={baud})")]
 
@@ -343,30 +508,24 @@ async def tool_read_uart(args: dict) -> list[TextContent]:
 
 async def tool_reset(args: dict) -> list[TextContent]:
     snr = args.get("snr")
-    nrfjprog = f"{TOOLCHAIN}/bin/nrfjprog"
-
-    # Fall back to system nrfjprog
-    if not Path(nrfjprog).exists():
-        nrfjprog = "nrfjprog"
 
-    cmd = [nrfjprog, "--reset"]
+    cmd = [NRFJPROG, "--reset"]
     if snr:
         cmd += ["--snr", snr]
 
-    result = run(cmd, timeout=30)
+    result = await run(cmd, timeout=30)
     return [TextContent(type="text", text=fmt(result, "RESET"))]
 
 
 async def tool_list_boards(args: dict) -> list[TextContent]:
-    nrfjprog = f"{TOOLCHAIN}/bin/nrfjprog"
-    if not Path(nrfjprog).exists():
-        nrfjprog = "nrfjprog"
-
-    result = run([nrfjprog, "--ids"], timeout=15)
+    # Probe J-Link and serial ports (for context) concurrently
+    result, comports = await asyncio.gather(
+        run([NRFJPROG, "--ids"], timeout=15),
+        asyncio.to_thread(_comports_cached),
+    )
 
-    # Also list serial ports for context
     ports = []
-    for p in serial.tools.list_ports.comports():
+    for p in comports:
         ports.append(f"  {p.device} — {p.description} [{p.manufacturer}]")
 
     output = fmt(result, "J-LINK BOARDS")
@@ -376,36 +535,53 @@ async def tool_list_boards(args: dict) -> list[TextContent]:
     return [TextContent(type="text", text=output)]
 
 
+def _read_if_exists(p: Path) -> str | None:
+    return p.read_text() if p.exists() else None
+
+
 async def tool_get_build_info(args: dict) -> list[TextContent]:
     sample_path = args["sample_path"]
     build_dir = Path(sample_path) / "build"
     output = []
 
+    vscode_txt, info_txt, domains_txt = await asyncio.gather(
+        asyncio.to_thread(_read_if_exists, build_dir / ".vscode-nrf-connect.json"),
+        asyncio.to_thread(_read_if_exists, build_dir / "build_info.yml"),
+        asyncio.to_thread(_read_if_exists, build_dir / "domains.yaml"),
+    )
+
     # .vscode-nrf-connect.json
-    vscode_cfg = build_dir / ".vscode-nrf-connect.json"
-    if vscode_cfg.exists():
+    if vscode_txt is not None:
         output.append("=== .vscode-nrf-connect.json ===")
-        output.append(vscode_cfg.read_text())
+        output.append(vscode_txt)
     else:
         output.append("=== .vscode-nrf-connect.json: NOT FOUND ===")
 
     # build_info.yml
-    build_info = build_dir / "build_info.yml"
-    if build_info.exists():
+    if info_txt is not None:
         output.append("=== build_info.yml ===")
-        output.append(build_info.read_text())
+        output.append(info_txt)
     else:
         output.append("=== build_info.yml: NOT FOUND ===")
 
     # domains.yaml (sysbuild)
-    domains = build_dir / "domains.yaml"
-    if domains.exists():
+    if domains_txt is not None:
         output.append("=== domains.yaml ===")
-        output.append(domains.read_text())
+        output.append(domains_txt)
 
     return [TextContent(type="text", text="\n\n".join(output))]
 
 
+_TOOLS: dict[str, Callable[[dict], Awaitable[list[TextContent]]]] = {
+    "build": tool_build,
+    "flash": tool_flash,
+    "read_uart_logs": tool_read_uart,
+    "reset_board": tool_reset,
+    "list_boards": tool_list_boards,
+    "get_build_info": tool_get_build_info,
+}
+
+
 # ─── Entry Point ──────────────────────────────────────────────────────────────
 
 async def _run():